@@ -6,6 +6,7 @@ All of the models are stored in this module
 import logging
 from datetime import date
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.pool import StaticPool
 
 logger = logging.getLogger("flask.app")
 
@@ -58,6 +59,11 @@ class PersistentBase:
         """Initializes the database session"""
         logger.info("Initializing database")
         cls.app = app
+        if app.config["SQLALCHEMY_DATABASE_URI"].startswith("sqlite"):
+            # Share one connection so an in-memory database is not lost
+            app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {}).update(
+                connect_args={"check_same_thread": False}, poolclass=StaticPool
+            )
         # This is where we initialize SQLAlchemy from the Flask app
         db.init_app(app)
         app.app_context().push()
@@ -0,0 +1,86 @@
+"""
+Test Suites for the Account Service
+
+The suites run against an in-memory SQLite database unless DATABASE_URI
+points them at a real one, e.g. Postgres for integration testing. Under
+pytest-xdist every worker gets a database of its own.
+
+This module configures the service once per test process for every
+runner, nose and unittest as well as pytest.
+"""
+import os
+import logging
+import sqlite3
+import psycopg2
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+
+def worker_database_uri(database_uri, worker):
+    """Returns the URI of a pytest-xdist worker's own database, creating it"""
+    url = make_url(database_uri)
+    if not worker or not url.drivername.startswith("postgresql"):
+        return database_uri
+
+    database = f"{url.database}_{worker}"
+    connection = psycopg2.connect(
+        dbname=url.database,
+        user=url.username,
+        password=url.password,
+        host=url.host,
+        port=url.port,
+    )
+    connection.autocommit = True  # CREATE DATABASE cannot run in a transaction
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (database,))
+        if not cursor.fetchone():
+            cursor.execute(f'CREATE DATABASE "{database}"')
+    connection.close()
+    return url.set(database=database).render_as_string(hide_password=False)
+
+
+@event.listens_for(Engine, "connect")
+def _sqlite_connect(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+    """Stops pysqlite from beginning transactions on its own"""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.isolation_level = None
+
+
+@event.listens_for(Engine, "begin")
+def _sqlite_begin(connection):
+    """Emits BEGIN for SQLite so the SAVEPOINTs of the route tests work"""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN")
+
+
+# Must be set before the service is imported because it creates its tables then
+os.environ["DATABASE_URI"] = worker_database_uri(
+    os.getenv("DATABASE_URI", "sqlite:///:memory:"),
+    os.getenv("PYTEST_XDIST_WORKER"),
+)
+
+# pylint: disable=wrong-import-position
+from service import app  # noqa: E402
+from service.models import db, init_db, Account  # noqa: E402
+
+app.config["TESTING"] = True
+app.config["DEBUG"] = False
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ["DATABASE_URI"]
+# Reuse a single connection for the whole run instead of a pool
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"poolclass": StaticPool}
+app.logger.setLevel(logging.CRITICAL)
+logging.getLogger("werkzeug").setLevel(logging.ERROR)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.ERROR)
+init_db(app)
+
+
+def truncate_accounts():
+    """Removes every Account, resetting the id sequence on Postgres"""
+    if db.engine.dialect.name == "postgresql":
+        db.session.execute(
+            text(f"TRUNCATE TABLE {Account.__tablename__} RESTART IDENTITY CASCADE")
+        )
+    else:
+        db.session.query(Account).delete()
+    db.session.commit()
@@ -0,0 +1,17 @@
+"""
+Shared pytest configuration for the Test Suites
+
+The suites can be spread across all CPU cores with pytest-xdist:
+  pytest -n auto tests/
+
+The database itself is set up by the tests package, see tests/__init__.py
+"""
+import pytest
+from service.models import db
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _db():
+    """Drops the tables once the test process is done with them"""
+    yield
+    db.drop_all()